@@ -3,8 +3,10 @@
 
 """Basic validator module."""
 
+import types
+import weakref
 from collections.abc import Iterable
-from typing import Any, List, Union
+from typing import Any, Callable, List, NamedTuple, Optional, Tuple, Union
 
 from typing_inspect import get_args, get_origin
 
@@ -45,9 +47,8 @@ def validator(field):
     """
 
     def _call(function):
-        def wrapper(field):
-            result = function(ConfigValidator, field)
-            return result
+        def wrapper(value):
+            return function(None, value)
 
         wrapper.decorator = True
         wrapper.field = field
@@ -63,6 +64,8 @@ class _AttributeErrorTypes:
 
 
 class _AttributeError(Exception):
+    __slots__ = ("name", "message")
+
     def __init__(self, name: str, message: str):
         self.name = name
         self.message = message
@@ -74,20 +77,21 @@ class _AttributeError(Exception):
 class ValidationError(Exception):
     """Raised by the ConfigValidator when the validation is not successful."""
 
+    __slots__ = ("exceptions", "attribute_errors", "_formatted")
     _message = "{} validation errors.\n{}"
 
     def __init__(self, exceptions: List[_AttributeError]):
         self.exceptions = exceptions
         self.attribute_errors = {e.name: e.message for e in self.exceptions}
+        self._formatted = self._message.format(
+            len(self.exceptions), "".join(map(str, self.exceptions))
+        )
 
     def __repr__(self):
-        return self._message.format(
-            len(self.exceptions),
-            "".join([str(exception) for exception in self.exceptions]),
-        )
+        return self._formatted
 
     def __str__(self):
-        return self.__repr__()
+        return self._formatted
 
 
 class ConfigValidator:
@@ -126,26 +130,107 @@ class ConfigValidator:
     """
 
     def __init__(self, **data: Any):
-        data = {k.replace("-", "_"): v for k, v in data.items()}
+        if any("-" in k for k in data):
+            data = {k.replace("-", "_"): v for k, v in data.items()}
 
         values, validation_error = validate_config(self.__class__, data)
 
         if validation_error:
             raise validation_error
 
-        setattr(self, "__dict__", values)
+        self.__dict__.update(values)
+
+
+class _AttributeKinds:
+    EXACT = 0
+    SCALAR = 1
+    LIST = 2
+    TUPLE_HOMOGENEOUS = 3
+    TUPLE_FIXED = 4
+    SET = 5
+    DICT = 6
+    ITERABLE = 7
+    UNSUPPORTED = 8
+
+
+_EXACT_TYPES = {bool, int, str, float}
+
+_NONE_TYPE = type(None)
+
+# PEP 604 unions (``int | None``) are only available from Python 3.10
+_UNION_TYPE = getattr(types, "UnionType", None)
+
+_CONTAINER_KINDS = {
+    list: _AttributeKinds.LIST,
+    tuple: _AttributeKinds.TUPLE_HOMOGENEOUS,
+    set: _AttributeKinds.SET,
+}
+
+
+class _Plan(NamedTuple):
+    """Precomputed validation plan of a ConfigValidator class."""
+
+    attributes: List[Tuple[str, int, Any, bool, Optional[Callable]]]
+
+
+_CLASS_PLAN_CACHE: "weakref.WeakKeyDictionary[type, _Plan]" = weakref.WeakKeyDictionary()
+
+
+def _build_plan(config) -> _Plan:
+    annotations = {}
+    decorators = {}
+    for base in reversed(config.__mro__):
+        annotations.update(base.__dict__.get("__annotations__", {}))
+        decorators.update(
+            (validator.field, validator)
+            for validator in base.__dict__.values()
+            if getattr(validator, "decorator", False)
+        )
+    attributes = []
+    for attr_name, attr_type in annotations.items():
+        optional, type_to_check, args_type = _resolve_annotation(attr_type)
+        kind, expected = _classify(type_to_check, args_type)
+        decorator = decorators.get(attr_name)
+        attributes.append((attr_name, kind, expected, optional, decorator))
+    return _Plan(attributes)
+
+
+def _classify(type_to_check, args_type):
+    unsupported_reason = _isinstance_error(type_to_check)
+    if unsupported_reason is not None:
+        return _AttributeKinds.UNSUPPORTED, unsupported_reason
+    if not args_type:
+        if type_to_check in _EXACT_TYPES:
+            return _AttributeKinds.EXACT, type_to_check
+        return _AttributeKinds.SCALAR, type_to_check
+    if type_to_check is tuple and len(args_type) == 2 and args_type[1] is Ellipsis:
+        return _AttributeKinds.TUPLE_HOMOGENEOUS, (tuple, args_type[0])
+    if type_to_check is tuple and len(args_type) > 1:
+        return _AttributeKinds.TUPLE_FIXED, (tuple, args_type)
+    if type_to_check in _CONTAINER_KINDS and len(args_type) == 1:
+        return _CONTAINER_KINDS[type_to_check], (type_to_check, args_type[0])
+    if type_to_check is dict and len(args_type) == 2:
+        return _AttributeKinds.DICT, (dict, args_type)
+    return _AttributeKinds.ITERABLE, (type_to_check, args_type)
+
+
+def _isinstance_error(type_to_check):
+    try:
+        isinstance(None, type_to_check)
+    except TypeError as e:
+        return str(e)
+    return None
+
+
+def _get_plan(config) -> _Plan:
+    plan = _CLASS_PLAN_CACHE.get(config)
+    if plan is None:
+        plan = _CLASS_PLAN_CACHE.setdefault(config, _build_plan(config))
+    return plan
 
 
 def validate_config(config, data):
-    validation_exceptions = []
-    config_attributes = getattr(config, "__annotations__")
-    __decorator_validators__ = {
-        validator.field: validator
-        for validator in config.__dict__.values()
-        if hasattr(validator, "decorator")
-    }
     error = None
-    values = {}
     # extra_attributes = [key for key in data if key not in config_attributes]
     # if extra_attributes:
     #     for extra_attr in extra_attributes:
@@ -153,61 +238,81 @@ def validate_config(config, data):
     #             AttributeError(extra_attr, AttributeErrorTypes.UNDEFINED)
     #         )
 
-    for attr_name, attr_type in config_attributes.items():
-        optional = _is_optional_type(attr_type)
-        type_to_check = _safe_get_type(attr_type)
-        args_type = _safe_get_args(attr_type)
-
-        data_value = data.get(attr_name)
-        if data_value is None and not optional:
-            validation_exceptions.append(_AttributeError(attr_name, _AttributeErrorTypes.MISSING))
-        else:
-            error_msg = ""
-            try:
-                _validate(data_value, type_to_check, args_type)
-                if attr_name in __decorator_validators__:
-                    data[attr_name] = __decorator_validators__[attr_name](data_value)
-            except Exception as e:
-                error_msg = str(e)
-                validation_exceptions.append(_AttributeError(attr_name, error_msg))
-                continue
+    values, validation_exceptions = _validate_plan(_get_plan(config).attributes, data)
     if validation_exceptions:
         error = ValidationError(exceptions=validation_exceptions)
-    else:
-        values.update({attr_name: data.get(attr_name) for attr_name in config_attributes})
+        values = {}
 
     return values, error
 
 
-def _safe_get_type(obj_type):
-    if _is_optional_type(obj_type):
-        return _safe_get_type(obj_type.__args__[0])
-    else:
-        origin = get_origin(obj_type)
-        return origin if origin is not None else obj_type
+def _validate_plan_python(attributes, data):
+    validation_exceptions = []
+    values = {}
+    for attr_name, kind, expected, optional, decorator in attributes:
+        data_value = data.get(attr_name)
+        if data_value is not None:
+            error_msg = _validate(data_value, kind, expected)
+        elif optional:
+            error_msg = None
+        else:
+            validation_exceptions.append(_AttributeError(attr_name, _AttributeErrorTypes.MISSING))
+            continue
+        if error_msg is None and decorator is not None:
+            try:
+                data_value = decorator(data_value)
+            except Exception as e:
+                error_msg = str(e)
+        if error_msg is not None:
+            validation_exceptions.append(_AttributeError(attr_name, error_msg))
+            continue
+        values[attr_name] = data_value
+    return values, validation_exceptions
 
 
-def _safe_get_args(obj_type):
-    if _is_optional_type(obj_type):
-        return _safe_get_args(obj_type.__args__[0])
+def _resolve_annotation(obj_type, optional=False):
+    origin = get_origin(obj_type)
+    args = get_args(obj_type)
+    pep604_union = _UNION_TYPE is not None and isinstance(obj_type, _UNION_TYPE)
+    if (origin is Union or pep604_union) and len(args) == 2 and _NONE_TYPE in args:
+        return _resolve_annotation(args[0] if args[1] is _NONE_TYPE else args[1], optional=True)
+    if pep604_union:
+        # Non-optional PEP 604 unions can be checked directly with isinstance()
+        return optional, obj_type, ()
+    return optional, origin if origin is not None else obj_type, tuple(args)
+
+
+def _validate(data_value, kind, expected):
+    if kind == _AttributeKinds.UNSUPPORTED:
+        return expected
+    if kind == _AttributeKinds.EXACT:
+        return None if type(data_value) is expected else _AttributeErrorTypes.INVALID_TYPE
+    if kind == _AttributeKinds.SCALAR:
+        return None if isinstance(data_value, expected) else _AttributeErrorTypes.INVALID_TYPE
+    container_type, item_types = expected
+    if not isinstance(data_value, container_type):
+        return _AttributeErrorTypes.INVALID_TYPE
+    if kind == _AttributeKinds.DICT:
+        key_type, value_type = item_types
+        invalid = any(
+            type(k) is not key_type or type(v) is not value_type for k, v in data_value.items()
+        )
+    elif kind == _AttributeKinds.TUPLE_FIXED:
+        invalid = len(data_value) != len(item_types) or any(
+            type(v) is not t for v, t in zip(data_value, item_types)
+        )
+    elif kind == _AttributeKinds.ITERABLE:
+        invalid = isinstance(data_value, Iterable) and any(
+            ((type(v), type(data_value[v])) if isinstance(data_value, dict) else (type(v),))
+            != item_types
+            for v in data_value
+        )
     else:
-        return get_args(obj_type)
+        invalid = any(type(v) is not item_types for v in data_value)
+    return _AttributeErrorTypes.INVALID_TYPE if invalid else None
 
 
-def _is_optional_type(obj_type):
-    origin = get_origin(obj_type)
-    args = get_args(obj_type)
-    return origin == Union and len(args) == 2 and args[1] is type(None)  # noqa: E721
-
-
-def _validate(data_value, type_to_check, args_type):
-    if data_value is not None:
-        if not isinstance(data_value, type_to_check):
-            raise Exception(_AttributeErrorTypes.INVALID_TYPE)
-        elif args_type and isinstance(data_value, Iterable):
-            for v in data_value:
-                tuple_of_types = (
-                    (type(v), type(data_value[v])) if isinstance(data_value, dict) else (type(v),)
-                )
-                if tuple_of_types != args_type:
-                    raise Exception(_AttributeErrorTypes.INVALID_TYPE)
+try:
+    from config_validator._fast import validate_plan as _validate_plan  # noqa: E402
+except ImportError:
+    _validate_plan = _validate_plan_python
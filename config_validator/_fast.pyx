@@ -0,0 +1,108 @@
+# cython: language_level=3
+# Copyright 2021 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Compiled version of the validation loop of config_validator.
+
+This module mirrors config_validator._validate_plan_python and is used instead of it
+when available. It must be kept in sync with the pure-Python implementation.
+"""
+
+from collections.abc import Iterable
+
+from config_validator import _AttributeError, _AttributeErrorTypes, _AttributeKinds
+
+
+cdef int EXACT = _AttributeKinds.EXACT
+cdef int SCALAR = _AttributeKinds.SCALAR
+cdef int TUPLE_FIXED = _AttributeKinds.TUPLE_FIXED
+cdef int DICT = _AttributeKinds.DICT
+cdef int ITERABLE = _AttributeKinds.ITERABLE
+cdef int UNSUPPORTED = _AttributeKinds.UNSUPPORTED
+cdef str INVALID_TYPE = _AttributeErrorTypes.INVALID_TYPE
+cdef str MISSING = _AttributeErrorTypes.MISSING
+
+
+cdef bint _invalid_elements(object data_value, int kind, object item_types):
+    cdef object k, v, t, key_type, value_type
+    if kind == DICT:
+        key_type, value_type = item_types
+        for k, v in data_value.items():
+            if type(k) is not key_type or type(v) is not value_type:
+                return True
+        return False
+    if kind == TUPLE_FIXED:
+        if len(data_value) != len(<tuple>item_types):
+            return True
+        for v, t in zip(data_value, <tuple>item_types):
+            if type(v) is not t:
+                return True
+        return False
+    if kind == ITERABLE:
+        if not isinstance(data_value, Iterable):
+            return False
+        for v in data_value:
+            if isinstance(data_value, dict):
+                if (type(v), type(data_value[v])) != item_types:
+                    return True
+            elif (type(v),) != item_types:
+                return True
+        return False
+    for v in data_value:
+        if type(v) is not item_types:
+            return True
+    return False
+
+
+cdef object _validate(object data_value, int kind, object expected):
+    cdef object container_type, item_types
+    if kind == UNSUPPORTED:
+        return expected
+    if kind == EXACT:
+        return None if type(data_value) is expected else INVALID_TYPE
+    if kind == SCALAR:
+        return None if isinstance(data_value, expected) else INVALID_TYPE
+    container_type, item_types = expected
+    if not isinstance(data_value, container_type):
+        return INVALID_TYPE
+    return INVALID_TYPE if _invalid_elements(data_value, kind, item_types) else None
+
+
+def validate_plan(list attributes, dict data):
+    """Validate data against the attributes of a class plan.
+
+    Args:
+        attributes: attribute entries of the class plan.
+        data: dictionary with the values to validate.
+
+    Returns:
+        Tuple with the dictionary of validated values and the list of
+        attribute errors.
+    """
+    cdef list validation_exceptions = []
+    cdef dict values = {}
+    cdef tuple entry
+    cdef str attr_name
+    cdef int kind
+    cdef bint optional
+    cdef object expected, decorator, data_value, error_msg
+    for entry in attributes:
+        attr_name, kind, expected, optional, decorator = entry
+        data_value = data.get(attr_name)
+        if data_value is not None:
+            error_msg = _validate(data_value, kind, expected)
+        elif optional:
+            error_msg = None
+        else:
+            validation_exceptions.append(_AttributeError(attr_name, MISSING))
+            continue
+        if error_msg is None and decorator is not None:
+            try:
+                data_value = decorator(data_value)
+            except Exception as e:
+                error_msg = str(e)
+        if error_msg is not None:
+            validation_exceptions.append(_AttributeError(attr_name, error_msg))
+            continue
+        values[attr_name] = data_value
+    return values, validation_exceptions
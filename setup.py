@@ -10,12 +10,33 @@ import re
 
 import setuptools
 
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
 
 def get_long_description():
     with open("README.md", "r") as fh:
         return fh.read()
 
 
+def get_ext_modules():
+    # The compiled validation loop is optional: without Cython, or if the
+    # extension fails to compile, the package falls back to the pure-Python
+    # implementation.
+    if cythonize is None:
+        return []
+    ext_modules = cythonize(
+        [setuptools.Extension("config_validator._fast", ["config_validator/_fast.pyx"])],
+        language_level=3,
+    )
+    # cythonize() does not carry the optional flag over to the extensions it returns
+    for ext in ext_modules:
+        ext.optional = True
+    return ext_modules
+
+
 def get_version():
     with open(os.path.join("config_validator", "__init__.py"), "r") as fh:
         pkg = fh.read()
@@ -39,6 +60,7 @@ with open("requirements.txt") as f:
         long_description_content_type="text/markdown",
         url="https://github.com/charmed-osm/config-validator",
         packages=["config_validator"],
+        ext_modules=get_ext_modules(),
         classifiers=[
             "Development Status :: 5 - Production/Stable",
             "Programming Language :: Python :: 3 :: Only",
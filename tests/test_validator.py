@@ -1,9 +1,16 @@
 # Copyright 2021 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-from typing import Dict, List, Optional, Set, Tuple
+import gc
+import sys
+import weakref
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple, Union
 
+import pytest
+
+import config_validator
 from config_validator import (
+    _CLASS_PLAN_CACHE,
     ConfigValidator,
     ValidationError,
     _AttributeError,
@@ -36,6 +43,16 @@ VALUES = {
 }
 
 
+@pytest.fixture(autouse=True, params=["compiled", "python"])
+def validate_plan_implementation(request, monkeypatch):
+    if request.param == "python":
+        monkeypatch.setattr(
+            config_validator, "_validate_plan", config_validator._validate_plan_python
+        )
+    elif config_validator._validate_plan is config_validator._validate_plan_python:
+        pytest.skip("compiled extension not available")
+
+
 class ExampleConfig(ConfigValidator):
     boolean: bool
     integer: int
@@ -67,6 +84,35 @@ class ExampleCustomValidationConfig(ConfigValidator):
         return v
 
 
+class ExampleInheritedConfig(ExampleCustomValidationConfig):
+    debug: Optional[bool]
+
+
+class ExampleNormalizingValidationConfig(ConfigValidator):
+    log_level: str
+
+    @validator("log_level")
+    def validate_log_level(self, v):
+        return v.upper()
+
+
+class ExampleTupleConfig(ConfigValidator):
+    variadic: Optional[Tuple[int, ...]]
+    fixed: Optional[Tuple[int, str]]
+
+
+class ExampleIterableConfig(ConfigValidator):
+    iterable: Optional[Iterable[int]]
+    frozen: Optional[FrozenSet[str]]
+
+
+class ExampleUnsupportedConfig(ConfigValidator):
+    union: Union[int, str]
+    anything: Any
+    forward_ref: "int"
+    optional_union: Optional[Union[int, str]]
+
+
 class ExampleMissingOptionalAttribute(ConfigValidator):
     optional: Optional[str]
 
@@ -93,6 +139,20 @@ def test_validator_mandatory_with_dash_success():
         assert config.__getattribute__(attr.replace("-", "_")) == value
 
 
+def test_validator_dashed_keys_success():
+    data = {attr.replace("_", "-"): value for attr, value in VALUES.items()}
+    config = ExampleConfig(**data)
+    for attr, value in VALUES.items():
+        assert config.__getattribute__(attr) == value
+
+
+def test_validator_mixed_dashed_keys_success():
+    data = {"-".join(attr.rsplit("_", 1)): value for attr, value in VALUES.items()}
+    config = ExampleConfig(**data)
+    for attr, value in VALUES.items():
+        assert config.__getattribute__(attr) == value
+
+
 def test_validator_wrong():
     testing_data = {attr: None for attr in MANDATORY_ATTRS}
     testing_data.update({f"opt_{attr}": None for attr in MANDATORY_ATTRS})
@@ -114,7 +174,6 @@ def test_validator_wrong():
                 key in e.attribute_errors
                 and e.attribute_errors[key] == _AttributeErrorTypes.INVALID_TYPE
                 for key in data
-                if not ("integer" in key and isinstance(data[key], bool))
             )
         assert raised
 
@@ -150,10 +209,140 @@ def test_custom_validator_exception():
     assert raised
 
 
+def test_inherited_attributes():
+    config = ExampleInheritedConfig(**{"log_level": "INFO", "debug": True})
+    assert config.log_level == "INFO"
+    assert config.debug is True
+
+
+def test_inherited_attributes_exception():
+    raised = False
+    try:
+        ExampleInheritedConfig(**{"log_level": "WRONG", "debug": "yes"})
+    except ValidationError as e:
+        raised = True
+        assert e.attribute_errors["log_level"] == "value must be INFO or DEBUG"
+        assert e.attribute_errors["debug"] == _AttributeErrorTypes.INVALID_TYPE
+    assert raised
+
+
+def test_custom_validator_updates_value():
+    config = ExampleNormalizingValidationConfig(**{"log_level": "info"})
+    assert config.log_level == "INFO"
+
+
+def test_tuple_success():
+    config = ExampleTupleConfig(**{"variadic": (1, 2, 3), "fixed": (1, "1")})
+    assert config.variadic == (1, 2, 3)
+    assert config.fixed == (1, "1")
+
+
+def test_tuple_wrong():
+    for data in ({"variadic": (1, "2")}, {"fixed": ("1", 1)}, {"fixed": (1, "1", 1)}):
+        raised = False
+        try:
+            ExampleTupleConfig(**data)
+        except ValidationError as e:
+            raised = True
+            assert all(
+                e.attribute_errors[key] == _AttributeErrorTypes.INVALID_TYPE for key in data
+            )
+        assert raised
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions require Python 3.10")
+def test_pep604_optional_attr():
+    class ExamplePep604Config(ConfigValidator):
+        integer: int | None
+        strings: None | List[str]
+
+    config = ExamplePep604Config(**{"strings": ["1"]})
+    assert config.integer is None
+    assert config.strings == ["1"]
+    raised = False
+    try:
+        ExamplePep604Config(**{"integer": "1", "strings": [1]})
+    except ValidationError as e:
+        raised = True
+        assert e.attribute_errors == {
+            "integer": _AttributeErrorTypes.INVALID_TYPE,
+            "strings": _AttributeErrorTypes.INVALID_TYPE,
+        }
+    assert raised
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="PEP 604 unions require Python 3.10")
+def test_pep604_union_attr():
+    class ExamplePep604UnionConfig(ConfigValidator):
+        value: int | str
+
+    assert ExamplePep604UnionConfig(**{"value": 1}).value == 1
+    assert ExamplePep604UnionConfig(**{"value": "1"}).value == "1"
+    raised = False
+    try:
+        ExamplePep604UnionConfig(**{"value": 1.0})
+    except ValidationError as e:
+        raised = True
+        assert e.attribute_errors == {"value": _AttributeErrorTypes.INVALID_TYPE}
+    assert raised
+
+
+def test_unsupported_annotations():
+    data = {"union": 1, "anything": 1, "forward_ref": 1, "optional_union": 1}
+    raised = False
+    try:
+        ExampleUnsupportedConfig(**data)
+    except ValidationError as e:
+        raised = True
+        assert set(e.attribute_errors) == set(data)
+        assert all("isinstance()" in message for message in e.attribute_errors.values())
+    assert raised
+
+
 def test_missing_optional_attr():
     ExampleMissingOptionalAttribute(**{})
 
 
+def test_custom_validator_mutable_result():
+    class ExampleSplitConfig(ConfigValidator):
+        hosts: str
+
+        @validator("hosts")
+        def validate_hosts(self, v):
+            return v.split(",")
+
+    ExampleSplitConfig(**{"hosts": "a,b"}).hosts.append("c")
+    assert ExampleSplitConfig(**{"hosts": "a,b"}).hosts == ["a", "b"]
+
+
+def test_custom_validator_called_per_instance():
+    calls = []
+
+    class ExampleCountingConfig(ConfigValidator):
+        log_level: str
+
+        @validator("log_level")
+        def validate_log_level(self, v):
+            calls.append(v)
+            return v
+
+    ExampleCountingConfig(**{"log_level": "INFO"})
+    ExampleCountingConfig(**{"log_level": "INFO"})
+    assert calls == ["INFO", "INFO"]
+
+
+def test_validation_errors_are_independent():
+    for _ in range(2):
+        raised = False
+        try:
+            ExampleConfig(**{"boolean": 1})
+        except ValidationError as e:
+            raised = True
+            assert e.attribute_errors["boolean"] == _AttributeErrorTypes.INVALID_TYPE
+            e.exceptions.clear()
+        assert raised
+
+
 def test_attribute_error_exception():
     exception = _AttributeError("name", "message")
     assert f"{exception}" == "name\n    message\n"
@@ -162,3 +351,60 @@ def test_attribute_error_exception():
 def test_validation_error():
     exception = ValidationError([_AttributeError("n1", "m1"), _AttributeError("n2", "m2")])
     assert f"{exception}" == "2 validation errors.\nn1\n    m1\nn2\n    m2\n"
+
+
+def test_plan_is_cached_per_class():
+    ExampleMissingOptionalAttribute(**{})
+    plan = _CLASS_PLAN_CACHE[ExampleMissingOptionalAttribute]
+    ExampleMissingOptionalAttribute(**{"optional": "value"})
+    assert _CLASS_PLAN_CACHE[ExampleMissingOptionalAttribute] is plan
+
+
+def test_plan_is_released_with_class():
+    class ExampleDynamicConfig(ConfigValidator):
+        items: List[int]
+
+    ExampleDynamicConfig(**{"items": [1]})
+    assert ExampleDynamicConfig in _CLASS_PLAN_CACHE
+    config_ref = weakref.ref(ExampleDynamicConfig)
+    del ExampleDynamicConfig
+    gc.collect()
+    assert config_ref() is None
+
+
+def test_validation_does_not_inspect_annotations(monkeypatch):
+    def _fail(*_):
+        raise AssertionError("typing introspection during validation")
+
+    data = {attr: VALUES[attr] for attr in MANDATORY_ATTRS}
+    ExampleConfig(**data)
+    monkeypatch.setattr(config_validator, "get_origin", _fail)
+    monkeypatch.setattr(config_validator, "get_args", _fail)
+    config = ExampleConfig(**data)
+    for attr, value in data.items():
+        assert config.__getattribute__(attr) == value
+
+
+COMPILED_CASES = [
+    (ExampleConfig, dict(VALUES, opt_integer=True, opt_list_str=[1], opt_dict_int_str={1: 1})),
+    (ExampleConfig, {}),
+    (ExampleTupleConfig, {"variadic": (1, 2), "fixed": (1, "1")}),
+    (ExampleTupleConfig, {"variadic": (1, "2"), "fixed": (1,)}),
+    (ExampleIterableConfig, {"iterable": [1, 2], "frozen": frozenset({"1"})}),
+    (ExampleIterableConfig, {"iterable": ["1"], "frozen": frozenset({1})}),
+    (ExampleCustomValidationConfig, {"log_level": "INFO"}),
+    (ExampleCustomValidationConfig, {"log_level": "WRONG"}),
+    (ExampleNormalizingValidationConfig, {"log_level": "info"}),
+    (ExampleMissingOptionalAttribute, {}),
+    (ExampleUnsupportedConfig, {"union": 1, "anything": 1}),
+]
+
+
+@pytest.mark.parametrize("config, data", COMPILED_CASES)
+def test_compiled_validate_plan(config, data):
+    fast = pytest.importorskip("config_validator._fast")
+    attributes = config_validator._get_plan(config).attributes
+    python_values, python_errors = config_validator._validate_plan_python(attributes, data)
+    fast_values, fast_errors = fast.validate_plan(attributes, data)
+    assert python_values == fast_values
+    assert [str(e) for e in python_errors] == [str(e) for e in fast_errors]